@@ -3,21 +3,104 @@ Provides LaTeX specific instantiation of the LanguageServer class using texlab.
 Contains various configurations and settings specific to LaTeX.
 """
 
+import functools
 import logging
 import os
 import pathlib
+import urllib.parse
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar, cast
 
 from overrides import override
 
 from solidlsp.ls import LanguageServerDependencyProvider, LanguageServerDependencyProviderSinglePath, SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
-from solidlsp.lsp_protocol_handler.lsp_types import InitializeParams
+from solidlsp.ls_utils import PlatformUtils
+from solidlsp.lsp_protocol_handler.lsp_types import ClientCapabilities, InitializeParams
 from solidlsp.settings import SolidLSPSettings
 
 from .common import RuntimeDependency, RuntimeDependencyCollection
 
 log = logging.getLogger(__name__)
 
+# texlab release version and download URLs
+TEXLAB_VERSION = "v5.25.1"
+TEXLAB_DOWNLOAD_BASE = f"https://github.com/latex-lsp/texlab/releases/download/{TEXLAB_VERSION}"
+
+# maps platform ids to the (asset name, archive type, binary name) of the corresponding texlab release asset
+_TEXLAB_ASSETS_BY_PLATFORM: dict[str, tuple[str, str, str]] = {
+    "linux-x64": ("texlab-x86_64-linux.tar.gz", "gztar", "texlab"),
+    "linux-arm64": ("texlab-aarch64-linux.tar.gz", "gztar", "texlab"),
+    "osx-x64": ("texlab-x86_64-macos.tar.gz", "gztar", "texlab"),
+    "osx-arm64": ("texlab-aarch64-macos.tar.gz", "gztar", "texlab"),
+    "win-x64": ("texlab-x86_64-windows.zip", "zip", "texlab.exe"),
+}
+
+_IGNORED_DIRNAMES = frozenset({"_minted", "auto", "pythontex-files-"})
+"""directories generated by LaTeX tooling (minted, AUCTeX, PythonTeX) which are always ignored"""
+
+_SYMBOL_KIND_VALUESET = tuple(range(1, 27))
+
+# the client capabilities do not depend on the repository and are not modified by the server, so they are shared by all instances
+_STATIC_CAPS: ClientCapabilities = {
+    "textDocument": {
+        "synchronization": {"didSave": True, "dynamicRegistration": True},
+        "completion": {
+            "dynamicRegistration": True,
+            "completionItem": {"snippetSupport": True},
+        },
+        "definition": {"dynamicRegistration": True},
+        "references": {"dynamicRegistration": True},
+        "documentSymbol": {
+            "dynamicRegistration": True,
+            "hierarchicalDocumentSymbolSupport": True,
+            "symbolKind": {"valueSet": _SYMBOL_KIND_VALUESET},  # type: ignore[typeddict-item]
+        },
+        "hover": {
+            "dynamicRegistration": True,
+            "contentFormat": ["markdown", "plaintext"],  # type: ignore[list-item]
+        },
+        "codeAction": {"dynamicRegistration": True},
+        "formatting": {"dynamicRegistration": True},
+    },
+    "workspace": {
+        "workspaceFolders": True,
+        "didChangeConfiguration": {"dynamicRegistration": True},
+        "symbol": {"dynamicRegistration": True},
+    },
+}
+
+_STATIC_INIT_PARAMS: Mapping[str, Any] = MappingProxyType({"locale": "en", "capabilities": _STATIC_CAPS})
+"""the repository-independent part of the initialize params"""
+
+
+def _fast_as_uri(absolute_path: str) -> str:
+    """
+    Converts the given absolute path to a file URI, like `pathlib.Path(absolute_path).as_uri()`,
+    but without constructing a path object on POSIX systems.
+    """
+    if os.name == "nt":
+        return pathlib.PureWindowsPath(absolute_path).as_uri()
+    return "file://" + urllib.parse.quote(os.fsencode(absolute_path))
+
+
+@functools.lru_cache(maxsize=64)
+def _root_uri(repository_absolute_path: str) -> tuple[str, str]:
+    """
+    :param repository_absolute_path: the absolute path of the repository root
+    :return: a tuple (uri, name) containing the root's file URI and the workspace folder name
+    """
+    return _fast_as_uri(repository_absolute_path), os.path.basename(repository_absolute_path)
+
+
+def _noop(_params: dict) -> None:
+    pass
+
+
+def _window_log_message(msg: dict) -> None:
+    log.info("LSP: window/logMessage: %s", msg)
+
 
 class Texlab(SolidLanguageServer):
     """
@@ -25,67 +108,82 @@ class Texlab(SolidLanguageServer):
     """
 
     class DependencyProvider(LanguageServerDependencyProviderSinglePath):
-        texlab_releases = "https://github.com/latex-lsp/texlab/releases/download/v5.25.1"
-        runtime_dependencies = RuntimeDependencyCollection(
-            [
-                RuntimeDependency(
-                    id="texlab",
-                    url=f"{texlab_releases}/texlab-x86_64-linux.tar.gz",
-                    platform_id="linux-x64",
-                    archive_type="gztar",
-                    binary_name="texlab",
-                ),
-                RuntimeDependency(
-                    id="texlab",
-                    url=f"{texlab_releases}/texlab-aarch64-linux.tar.gz",
-                    platform_id="linux-arm64",
-                    archive_type="gztar",
-                    binary_name="texlab",
-                ),
-                RuntimeDependency(
-                    id="texlab",
-                    url=f"{texlab_releases}/texlab-x86_64-macos.tar.gz",
-                    platform_id="osx-x64",
-                    archive_type="gztar",
-                    binary_name="texlab",
-                ),
-                RuntimeDependency(
-                    id="texlab",
-                    url=f"{texlab_releases}/texlab-aarch64-macos.tar.gz",
-                    platform_id="osx-arm64",
-                    archive_type="gztar",
-                    binary_name="texlab",
-                ),
-                RuntimeDependency(
-                    id="texlab",
-                    url=f"{texlab_releases}/texlab-x86_64-windows.zip",
-                    platform_id="win-x64",
-                    archive_type="zip",
-                    binary_name="texlab.exe",
-                ),
-            ]
-        )
+        _cached_executable_paths: ClassVar[dict[str, str]] = {}
+        """
+        maps resource directories to the texlab executable paths already resolved within this process,
+        such that subsequent server starts can skip the installation check
+        """
+
+        @functools.cached_property
+        def _current_dep(self) -> RuntimeDependency:
+            """The texlab dependency for the current platform."""
+            platform_id = PlatformUtils.get_platform_id().value
+            try:
+                asset_name, archive_type, binary_name = _TEXLAB_ASSETS_BY_PLATFORM[platform_id]
+            except KeyError:
+                raise RuntimeError(f"texlab is not available for platform {platform_id}") from None
+            return RuntimeDependency(
+                id="texlab",
+                url=f"{TEXLAB_DOWNLOAD_BASE}/{asset_name}",
+                platform_id=platform_id,
+                archive_type=archive_type,
+                binary_name=binary_name,
+            )
 
         def _get_or_install_core_dependency(self) -> str:
             """Setup runtime dependencies for texlab and return the path to the executable."""
-            deps = self.runtime_dependencies
-            dependency = deps.get_single_dep_for_current_platform()
-
-            texlab_ls_dir = self._ls_resources_dir
-            texlab_executable_path = deps.binary_path(texlab_ls_dir)
-            if not os.path.exists(texlab_executable_path):
-                log.info(
-                    f"Downloading texlab from {dependency.url} to {texlab_ls_dir}",
-                )
-                deps.install(texlab_ls_dir)
-            if not os.path.exists(texlab_executable_path):
-                raise FileNotFoundError(f"Download failed? Could not find texlab executable at {texlab_executable_path}")
-            os.chmod(texlab_executable_path, 0o755)
+            # the release is immutable, so installations are keyed by version and reused until the version changes
+            texlab_ls_dir = os.path.join(self._ls_resources_dir, f"texlab-{TEXLAB_VERSION}")
+            cached_executable_path = self._cached_executable_paths.get(texlab_ls_dir)
+            if cached_executable_path is not None and os.access(cached_executable_path, os.X_OK):
+                return cached_executable_path
+
+            dependency = self._current_dep
+
+            assert dependency.binary_name is not None
+            texlab_executable_path = os.path.join(texlab_ls_dir, dependency.binary_name)
+            try:
+                executable_stat = os.stat(texlab_executable_path)
+            except FileNotFoundError:
+                log.info("Downloading texlab from %s to %s", dependency.url, texlab_ls_dir)
+                RuntimeDependencyCollection([dependency]).install(texlab_ls_dir)
+                if not os.path.isfile(texlab_executable_path):
+                    raise FileNotFoundError(f"Download failed? Could not find texlab executable at {texlab_executable_path}") from None
+                # mark the binary as executable once at installation time, such that regular starts require no chmod
+                # (on Windows, executability does not depend on mode bits)
+                if os.name != "nt":
+                    os.chmod(texlab_executable_path, 0o755)
+                self._remove_legacy_installation(dependency.binary_name)
+            else:
+                # an existing installation only needs repairing if the executable bit got lost;
+                # the mode bits of the stat result tell us this without a separate os.access call
+                if os.name != "nt" and not executable_stat.st_mode & 0o111:
+                    os.chmod(texlab_executable_path, 0o755)
+            self._cached_executable_paths[texlab_ls_dir] = texlab_executable_path
             return texlab_executable_path
 
+        def _remove_legacy_installation(self, binary_name: str) -> None:
+            """
+            Removes, on a best-effort basis, the binary of a texlab installation predating versioned installation directories.
+            Directories of other texlab versions are kept, as they may be in use by other Serena versions sharing the resources directory.
+            """
+            legacy_executable_path = os.path.join(self._ls_resources_dir, binary_name)
+            if not os.path.isfile(legacy_executable_path):
+                return
+            log.info("Removing legacy texlab installation %s", legacy_executable_path)
+            try:
+                os.remove(legacy_executable_path)
+            except OSError as e:
+                log.warning("Could not remove legacy texlab installation %s: %s", legacy_executable_path, e)
+
         def _create_launch_command(self, core_path: str) -> list[str]:
             return [core_path]
 
+    _pid: ClassVar[int] = os.getpid()
+    """the id of the current process (sent to texlab as the parent process id), refreshed in forked child processes"""
+    _capability_check_done: ClassVar[bool] = False
+    """whether the server capabilities have already been verified within this process"""
+
     def __init__(self, config: LanguageServerConfig, repository_root_path: str, solidlsp_settings: SolidLSPSettings):
         """
         Creates a Texlab instance. This class is not meant to be instantiated directly.
@@ -99,92 +197,74 @@ class Texlab(SolidLanguageServer):
             solidlsp_settings,
         )
 
+    @classmethod
+    def _refresh_pid(cls) -> None:
+        cls._pid = os.getpid()
+
     def _create_dependency_provider(self) -> LanguageServerDependencyProvider:
         return self.DependencyProvider(self._custom_settings, self._ls_resources_dir)
 
     @override
     def is_ignored_dirname(self, dirname: str) -> bool:
-        return super().is_ignored_dirname(dirname) or dirname in ["_minted", "auto", "pythontex-files-"]
+        return dirname in _IGNORED_DIRNAMES or super().is_ignored_dirname(dirname)
 
     @staticmethod
     def _get_initialize_params(repository_absolute_path: str) -> InitializeParams:
         """
         Returns the initialize params for the texlab Language Server.
         """
-        root_uri = pathlib.Path(repository_absolute_path).as_uri()
-        initialize_params: InitializeParams = {  # type: ignore
-            "processId": os.getpid(),
-            "locale": "en",
+        root_uri, root_name = _root_uri(repository_absolute_path)
+        initialize_params = {
+            **_STATIC_INIT_PARAMS,
+            "processId": Texlab._pid,
             "rootPath": repository_absolute_path,
             "rootUri": root_uri,
-            "capabilities": {
-                "textDocument": {
-                    "synchronization": {"didSave": True, "dynamicRegistration": True},
-                    "completion": {
-                        "dynamicRegistration": True,
-                        "completionItem": {"snippetSupport": True},
-                    },
-                    "definition": {"dynamicRegistration": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},  # type: ignore[arg-type]
-                    },
-                    "hover": {
-                        "dynamicRegistration": True,
-                        "contentFormat": ["markdown", "plaintext"],  # type: ignore[list-item]
-                    },
-                    "codeAction": {"dynamicRegistration": True},
-                    "formatting": {"dynamicRegistration": True},
-                },
-                "workspace": {
-                    "workspaceFolders": True,
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "symbol": {"dynamicRegistration": True},
-                },
-            },
-            "workspaceFolders": [
-                {
-                    "uri": root_uri,
-                    "name": os.path.basename(repository_absolute_path),
-                }
-            ],
+            "workspaceFolders": [{"uri": root_uri, "name": root_name}],
         }
-        return initialize_params
+        return cast(InitializeParams, initialize_params)
 
     def _start_server(self) -> None:
         """
         Starts the texlab Language Server and waits for it to be ready.
         """
+        self._start_server_prelude()
+        initialize_params = self._get_initialize_params(self.repository_root_path)
 
-        def register_capability_handler(_params: dict) -> None:
-            return
+        log.info("Sending initialize request from LSP client to texlab server and awaiting response")
+        init_response = self.server.send.initialize(initialize_params)
+        log.debug("Received initialize response from texlab server: %s", init_response)
 
-        def window_log_message(msg: dict) -> None:
-            log.info(f"LSP: window/logMessage: {msg}")
+        # Verify server capabilities (once per process, since the server's capabilities do not change between starts)
+        if not Texlab._capability_check_done:
+            capabilities = init_response["capabilities"]
+            for capability in ("textDocumentSync", "completionProvider", "definitionProvider"):
+                if capability not in capabilities:
+                    raise RuntimeError(f"texlab server does not provide the required capability '{capability}'")
+            Texlab._capability_check_done = True
 
-        def do_nothing(_params: dict) -> None:
-            return
+        self._register_post_initialize_handlers()
+        self.server.notify.initialized({})
 
-        self.server.on_request("client/registerCapability", register_capability_handler)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
+        log.info("Texlab server initialization complete")
+
+    def _start_server_prelude(self) -> None:
+        """
+        Registers only the handlers that are needed during the initialize handshake and starts the server process.
+        """
+        self.server.on_request("client/registerCapability", _noop)
+        self.server.on_notification("window/logMessage", _window_log_message)
 
         log.info("Starting texlab server process")
         self.server.start()
-        initialize_params = self._get_initialize_params(self.repository_root_path)
-
-        log.info("Sending initialize request from LSP client to texlab server and awaiting response")
-        init_response = self.server.send.initialize(initialize_params)
-        log.debug(f"Received initialize response from texlab server: {init_response}")
 
-        # Verify server capabilities
-        assert "textDocumentSync" in init_response["capabilities"]
-        assert "completionProvider" in init_response["capabilities"]
-        assert "definitionProvider" in init_response["capabilities"]
+    def _register_post_initialize_handlers(self) -> None:
+        """
+        Sets up the handling of notifications which texlab only emits once the client has sent `initialized`
+        (all of which are discarded without being decoded).
+        """
+        self.server.ignore_notification("$/progress")
+        self.server.ignore_notification("textDocument/publishDiagnostics")
 
-        self.server.notify.initialized({})
 
-        log.info("Texlab server initialization complete")
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=Texlab._refresh_pid)
@@ -3,6 +3,7 @@ import json
 import logging
 import os
 import platform
+import re
 import subprocess
 import threading
 import time
@@ -36,6 +37,12 @@ from solidlsp.util.subprocess_util import quote_arg, subprocess_kwargs
 
 log = logging.getLogger(__name__)
 
+_LEADING_METHOD_PATTERN = re.compile(rb'\A\s*\{\s*(?:"jsonrpc"\s*:\s*"2\.0"\s*,\s*)?"method"\s*:\s*"([^"\\]*)"')
+"""
+matches the method of a message body whose top-level object starts with the method (optionally preceded by the jsonrpc version),
+which allows the method to be determined without decoding the entire body
+"""
+
 
 class LanguageServerTerminatedException(Exception):
     """
@@ -150,6 +157,7 @@ class LanguageServerProcess:
         self._pending_requests: dict[Any, Request] = {}
         self.on_request_handlers: dict[str, Callable[[Any], Any]] = {}
         self.on_notification_handlers: dict[str, Callable[[Any], None]] = {}
+        self._ignored_notification_methods: set[str] = set()
         self._trace_log_fn = logger
         self.tasks: dict[int, Any] = {}
         self.task_counter = 0
@@ -397,6 +405,8 @@ class LanguageServerProcess:
         """
         Parse the body text received from the language server process and invoke the appropriate handler
         """
+        if self._ignored_notification_methods and self._is_ignored_notification(body):
+            return
         try:
             self._receive_payload(json.loads(body))
         except OSError as ex:
@@ -406,6 +416,14 @@ class LanguageServerProcess:
         except json.JSONDecodeError as ex:
             log.error(f"JSON decoding error: {ex}")
 
+    def _is_ignored_notification(self, body: bytes) -> bool:
+        """
+        Checks whether the given (undecoded) message body is a notification whose method is to be ignored.
+        Bodies for which the method cannot be determined without decoding them are never considered ignored.
+        """
+        match = _LEADING_METHOD_PATTERN.match(body)
+        return match is not None and match.group(1).decode(ENCODING) in self._ignored_notification_methods
+
     def _receive_payload(self, payload: StringDict) -> None:
         """
         Determine if the payload received from server is for a request, response, or notification and invoke the appropriate handler
@@ -510,6 +528,14 @@ class LanguageServerProcess:
         """
         self.on_notification_handlers[method] = cb
 
+    def ignore_notification(self, method: str) -> None:
+        """
+        Discard notifications from the server for the given method before their body is decoded.
+        This is intended for high-volume notifications the client has no use for (e.g. `$/progress`);
+        the method must only ever be used for notifications, never for requests from the server.
+        """
+        self._ignored_notification_methods.add(method)
+
     def _response_handler(self, response: StringDict) -> None:
         """
         Handle the response received from the server for a request, using the id to determine the request
@@ -560,6 +586,8 @@ class LanguageServerProcess:
         Handle the notification received from the server: call the appropriate callback function
         """
         method = response.get("method", "")
+        if method in self._ignored_notification_methods:
+            return
         params = response.get("params")
         handler = self.on_notification_handlers.get(method)
         if not handler:
@@ -8,6 +8,8 @@ import os
 import platform
 import shutil
 import subprocess
+import tarfile
+import tempfile
 import uuid
 import zipfile
 from enum import Enum
@@ -221,16 +223,16 @@ class FileUtils:
         """
         Downloads the archive from the given URL having format {archive_type} and extracts it to the given {target_path}
         """
+        if archive_type in ["tar", "gztar", "bztar", "xztar"]:
+            FileUtils._download_and_extract_tar_archive(url, target_path)
+            return
         try:
             tmp_files = []
             tmp_file_name = str(PurePath(os.path.expanduser("~"), "solidlsp_tmp", uuid.uuid4().hex))
             tmp_files.append(tmp_file_name)
             os.makedirs(os.path.dirname(tmp_file_name), exist_ok=True)
             FileUtils.download_file(url, tmp_file_name)
-            if archive_type in ["tar", "gztar", "bztar", "xztar"]:
-                os.makedirs(target_path, exist_ok=True)
-                shutil.unpack_archive(tmp_file_name, target_path, archive_type)
-            elif archive_type == "zip":
+            if archive_type == "zip":
                 os.makedirs(target_path, exist_ok=True)
                 with zipfile.ZipFile(tmp_file_name, "r") as zip_ref:
                     for zip_info in zip_ref.infolist():
@@ -267,6 +269,57 @@ class FileUtils:
                 if os.path.exists(tmp_file_name):
                     Path.unlink(Path(tmp_file_name))
 
+    @staticmethod
+    def _download_and_extract_tar_archive(url: str, target_path: str) -> None:
+        """
+        Downloads the (possibly compressed) tar archive from the given URL and extracts it while it is being downloaded,
+        i.e. without writing the archive to a temporary file.
+        The archive is extracted to a temporary directory next to {target_path} and its contents are only moved to {target_path}
+        once the extraction has succeeded, such that an interrupted download does not leave partially written files behind.
+        """
+        try:
+            response = requests.get(url, stream=True, timeout=60)
+        except Exception as exc:
+            log.error(f"Error downloading file '{url}': {exc}")
+            raise SolidLSPException("Error downloading file.") from exc
+        with response:
+            if response.status_code != 200:
+                log.error(f"Error downloading file '{url}': {response.status_code} {response.text}")
+                raise SolidLSPException("Error downloading file.")
+            parent_dir = os.path.dirname(os.path.abspath(target_path))
+            os.makedirs(parent_dir, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=".solidlsp_extract_", dir=parent_dir)
+            try:
+                with tarfile.open(fileobj=response.raw, mode="r|*") as tar:
+                    tar.extractall(tmp_dir)
+                FileUtils._move_directory_contents(tmp_dir, target_path)
+            except Exception as exc:
+                log.error(f"Error extracting tar archive obtained from '{url}': {exc}")
+                raise SolidLSPException("Error extracting archive.") from exc
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _move_directory_contents(source_dir: str, target_dir: str) -> None:
+        """
+        Moves the contents of {source_dir} into {target_dir}, merging with existing directories and replacing existing files
+        (as extracting into {target_dir} directly would)
+        """
+        os.makedirs(target_dir, exist_ok=True)
+        for name in os.listdir(source_dir):
+            source_path = os.path.join(source_dir, name)
+            target_path = os.path.join(target_dir, name)
+            source_is_dir = os.path.isdir(source_path) and not os.path.islink(source_path)
+            target_is_dir = os.path.isdir(target_path) and not os.path.islink(target_path)
+            if source_is_dir and target_is_dir:
+                FileUtils._move_directory_contents(source_path, target_path)
+                continue
+            if target_is_dir:
+                shutil.rmtree(target_path)
+            elif source_is_dir and os.path.lexists(target_path):
+                os.remove(target_path)
+            os.replace(source_path, target_path)
+
 
 class PlatformId(str, Enum):
     WIN_x86 = "win-x86"
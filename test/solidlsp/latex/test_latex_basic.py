@@ -5,23 +5,48 @@ These tests validate the functionality of the language server APIs
 like request_document_symbols using the LaTeX test repository.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
 import pytest
 
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
+from solidlsp.ls_types import UnifiedSymbolInformation
+
+# main.tex is deliberately not prefetched: its test covers requesting the symbols of a file that is not open yet
+PREFETCHED_SYMBOL_TEST_FILES = ("refs.bib", "custom.sty")
+
+
+@pytest.fixture(scope="module")
+def all_symbols_by_file(language_server: SolidLanguageServer) -> dict[str, list[UnifiedSymbolInformation]]:
+    """
+    Maps each of the prefetched symbol test files to all of its symbols.
+    The files are opened in texlab up front and their symbols are then requested concurrently.
+    """
+
+    def request_all_symbols(relative_path: str) -> list[UnifiedSymbolInformation]:
+        all_symbols, _root_symbols = language_server.request_document_symbols(relative_path).get_all_symbols_and_roots()
+        return all_symbols
+
+    with ExitStack() as stack:
+        for relative_path in PREFETCHED_SYMBOL_TEST_FILES:
+            stack.enter_context(language_server.open_file(relative_path))
+        with ThreadPoolExecutor(max_workers=len(PREFETCHED_SYMBOL_TEST_FILES)) as executor:
+            futures = {relative_path: executor.submit(request_all_symbols, relative_path) for relative_path in PREFETCHED_SYMBOL_TEST_FILES}
+            return {relative_path: future.result() for relative_path, future in futures.items()}
 
 
 @pytest.mark.latex
+@pytest.mark.parametrize("language_server", [Language.LATEX], indirect=True)
 class TestLatexLanguageServerBasics:
     """Test basic functionality of the LaTeX language server."""
 
-    @pytest.mark.parametrize("language_server", [Language.LATEX], indirect=True)
     def test_latex_language_server_initialization(self, language_server: SolidLanguageServer) -> None:
         """Test that LaTeX language server can be initialized successfully."""
         assert language_server is not None
         assert language_server.language == Language.LATEX
 
-    @pytest.mark.parametrize("language_server", [Language.LATEX], indirect=True)
     def test_latex_request_document_symbols(self, language_server: SolidLanguageServer) -> None:
         """Test request_document_symbols for LaTeX files."""
         all_symbols, _root_symbols = language_server.request_document_symbols("main.tex").get_all_symbols_and_roots()
@@ -35,18 +60,16 @@ class TestLatexLanguageServerBasics:
             f"Should find section symbols, got: {symbol_names}"
         )
 
-    @pytest.mark.parametrize("language_server", [Language.LATEX], indirect=True)
-    def test_latex_request_symbols_from_bib(self, language_server: SolidLanguageServer) -> None:
+    def test_latex_request_symbols_from_bib(self, all_symbols_by_file: dict[str, list[UnifiedSymbolInformation]]) -> None:
         """Test symbol detection in .bib files."""
-        all_symbols, _root_symbols = language_server.request_document_symbols("refs.bib").get_all_symbols_and_roots()
+        all_symbols = all_symbols_by_file["refs.bib"]
 
         # texlab should detect bib entries as symbols
         assert len(all_symbols) > 0, f"Should find entries in refs.bib, found {len(all_symbols)}"
 
-    @pytest.mark.parametrize("language_server", [Language.LATEX], indirect=True)
-    def test_latex_request_symbols_from_sty(self, language_server: SolidLanguageServer) -> None:
+    def test_latex_request_symbols_from_sty(self, all_symbols_by_file: dict[str, list[UnifiedSymbolInformation]]) -> None:
         """Test symbol detection in .sty files."""
-        all_symbols, _root_symbols = language_server.request_document_symbols("custom.sty").get_all_symbols_and_roots()
+        all_symbols = all_symbols_by_file["custom.sty"]
 
         # .sty files may have limited symbol support; just verify the API works
         assert all_symbols is not None, "Should return symbols list for .sty file"
@@ -0,0 +1,123 @@
+"""Unit tests for the texlab dependency provider (installation checks without network access)."""
+
+import os
+import tempfile
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from solidlsp.language_servers.common import RuntimeDependencyCollection
+from solidlsp.language_servers.texlab import TEXLAB_VERSION, Texlab
+from solidlsp.settings import SolidLSPSettings
+
+_BINARY_NAME = "texlab.exe" if os.name == "nt" else "texlab"
+
+
+def _fake_install(target_dir: str) -> dict[str, str]:
+    os.makedirs(target_dir, exist_ok=True)
+    executable_path = os.path.join(target_dir, _BINARY_NAME)
+    with open(executable_path, "w") as f:
+        f.write("")
+    return {"texlab": executable_path}
+
+
+def _create_provider(ls_resources_dir: str) -> Texlab.DependencyProvider:
+    return Texlab.DependencyProvider(SolidLSPSettings.CustomLSSettings({}), ls_resources_dir)
+
+
+def _create_fake_executable(ls_resources_dir: str) -> str:
+    texlab_ls_dir = os.path.join(ls_resources_dir, f"texlab-{TEXLAB_VERSION}")
+    os.makedirs(texlab_ls_dir)
+    executable_path = os.path.join(texlab_ls_dir, "texlab.exe" if os.name == "nt" else "texlab")
+    with open(executable_path, "w") as f:
+        f.write("")
+    os.chmod(executable_path, 0o755)
+    return executable_path
+
+
+@pytest.mark.latex
+class TestTexlabDependencyProvider:
+    def test_existing_executable_is_not_reinstalled(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            executable_path = _create_fake_executable(ls_resources_dir)
+            with patch.object(RuntimeDependencyCollection, "install") as mock_install:
+                assert _create_provider(ls_resources_dir)._get_or_install_core_dependency() == executable_path
+                mock_install.assert_not_called()
+
+    def test_resolved_executable_path_is_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            executable_path = _create_fake_executable(ls_resources_dir)
+            assert _create_provider(ls_resources_dir)._get_or_install_core_dependency() == executable_path
+
+            # on a cache hit, neither the platform dependency is resolved nor is an installation attempted
+            with patch.object(Texlab.DependencyProvider, "_current_dep", new_callable=PropertyMock) as mock_current_dep:
+                with patch.object(RuntimeDependencyCollection, "install") as mock_install:
+                    assert _create_provider(ls_resources_dir)._get_or_install_core_dependency() == executable_path
+                    mock_current_dep.assert_not_called()
+                    mock_install.assert_not_called()
+
+    def test_missing_executable_bit_is_restored(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            executable_path = _create_fake_executable(ls_resources_dir)
+            os.chmod(executable_path, 0o644)
+            assert _create_provider(ls_resources_dir)._get_or_install_core_dependency() == executable_path
+            assert os.access(executable_path, os.X_OK)
+
+    def test_failed_download_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            with patch.object(RuntimeDependencyCollection, "install") as mock_install:
+                with pytest.raises(FileNotFoundError, match="Download failed"):
+                    _create_provider(ls_resources_dir)._get_or_install_core_dependency()
+                mock_install.assert_called_once_with(os.path.join(ls_resources_dir, f"texlab-{TEXLAB_VERSION}"))
+
+    @pytest.mark.skipif(os.name == "nt", reason="mode bits are not relevant on Windows")
+    def test_installed_executable_is_made_executable(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+
+            def install_without_executable_bit(target_dir: str) -> dict[str, str]:
+                os.makedirs(target_dir, exist_ok=True)
+                executable_path = os.path.join(target_dir, "texlab")
+                with open(executable_path, "w") as f:
+                    f.write("")
+                os.chmod(executable_path, 0o644)
+                return {"texlab": executable_path}
+
+            with patch.object(RuntimeDependencyCollection, "install", side_effect=install_without_executable_bit):
+                executable_path = _create_provider(ls_resources_dir)._get_or_install_core_dependency()
+            assert os.access(executable_path, os.X_OK)
+
+    def test_legacy_installation_is_removed_on_install(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            legacy_executable_path = os.path.join(ls_resources_dir, _BINARY_NAME)
+            with open(legacy_executable_path, "w") as f:
+                f.write("")
+            other_version_dir = os.path.join(ls_resources_dir, "texlab-v5.0.0")
+            os.makedirs(other_version_dir)
+
+            with patch.object(RuntimeDependencyCollection, "install", side_effect=_fake_install):
+                executable_path = _create_provider(ls_resources_dir)._get_or_install_core_dependency()
+
+            assert os.path.isfile(executable_path)
+            assert not os.path.exists(legacy_executable_path)
+            assert os.path.isdir(other_version_dir), "installations of other versions may be in use by other Serena versions"
+
+    def test_failed_legacy_removal_does_not_abort_start(self) -> None:
+        with tempfile.TemporaryDirectory() as ls_resources_dir:
+            legacy_executable_path = os.path.join(ls_resources_dir, _BINARY_NAME)
+            with open(legacy_executable_path, "w") as f:
+                f.write("")
+
+            real_remove = os.remove
+
+            def remove_failing_for_legacy_executable(path: str) -> None:
+                # simulates a legacy binary which is still in use (Windows); other paths are removed as usual
+                if path == legacy_executable_path:
+                    raise PermissionError(f"file in use: {path}")
+                real_remove(path)
+
+            with patch.object(RuntimeDependencyCollection, "install", side_effect=_fake_install):
+                with patch("solidlsp.language_servers.texlab.os.remove", side_effect=remove_failing_for_legacy_executable):
+                    executable_path = _create_provider(ls_resources_dir)._get_or_install_core_dependency()
+
+            assert os.path.isfile(executable_path)
+            assert os.path.isfile(legacy_executable_path)
@@ -0,0 +1,26 @@
+import json
+import os
+import pathlib
+
+import pytest
+
+from solidlsp.language_servers.texlab import Texlab
+from solidlsp.lsp_protocol_handler.server import create_message, make_request
+
+
+@pytest.mark.latex
+@pytest.mark.skipif(os.name == "nt", reason="POSIX paths")
+@pytest.mark.parametrize("repository_path", ["/home/user/thesis", "/tmp/my thesis", "/tmp/thèse#1", "/tmp/a%20b?c"])
+def test_root_uri_matches_pathlib(repository_path: str) -> None:
+    initialize_params = Texlab._get_initialize_params(repository_path)
+    expected_uri = pathlib.Path(repository_path).as_uri()
+    assert initialize_params["rootUri"] == expected_uri
+    assert initialize_params["workspaceFolders"] == [{"uri": expected_uri, "name": os.path.basename(repository_path)}]
+
+
+@pytest.mark.latex
+def test_symbol_kind_value_set_is_sent_as_json_array() -> None:
+    """The value set is stored as a tuple but must be serialized like the list of all 26 symbol kinds."""
+    _header, _content_type, body = create_message(make_request("initialize", 1, dict(Texlab._get_initialize_params("/tmp/thesis"))))
+    symbol_kind = json.loads(body)["params"]["capabilities"]["textDocument"]["documentSymbol"]["symbolKind"]
+    assert symbol_kind == {"valueSet": list(range(1, 27))}
@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from solidlsp.ls_config import Language
+from solidlsp.ls_process import LanguageServerProcess
+from solidlsp.lsp_protocol_handler.server import ProcessLaunchInfo
+
+
+@pytest.fixture
+def ls_process() -> LanguageServerProcess:
+    return LanguageServerProcess(ProcessLaunchInfo(cmd=["unused"]), Language.LATEX, determine_log_level=lambda _line: 0)
+
+
+class TestIgnoredNotifications:
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"jsonrpc":"2.0","method":"$/progress","params":{"token":1}}',
+            b'{ "jsonrpc": "2.0", "method": "$/progress", "params": {"token": 1} }',
+            b'{"method":"$/progress","params":{"token":1},"jsonrpc":"2.0"}',
+        ],
+    )
+    def test_ignored_notification_is_not_decoded(self, ls_process: LanguageServerProcess, body: bytes) -> None:
+        ls_process.ignore_notification("$/progress")
+        ls_process._receive_payload = MagicMock()  # type: ignore[method-assign]
+        ls_process._handle_body(body)
+        ls_process._receive_payload.assert_not_called()
+
+    def test_ignored_notification_with_leading_id_is_discarded_after_decoding(self, ls_process: LanguageServerProcess) -> None:
+        handler = MagicMock()
+        ls_process.on_notification("$/progress", handler)
+        ls_process.ignore_notification("$/progress")
+        ls_process._handle_body(b'{"params":{"token":1},"method":"$/progress","jsonrpc":"2.0"}')
+        handler.assert_not_called()
+
+    def test_other_messages_are_dispatched(self, ls_process: LanguageServerProcess) -> None:
+        handler = MagicMock()
+        ls_process.on_notification("window/logMessage", handler)
+        ls_process.ignore_notification("$/progress")
+        ls_process._handle_body(b'{"jsonrpc":"2.0","method":"window/logMessage","params":{"message":"\\"method\\":\\"$/progress\\""}}')
+        handler.assert_called_once_with({"message": '"method":"$/progress"'})
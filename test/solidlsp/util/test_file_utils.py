@@ -0,0 +1,92 @@
+import io
+import os
+import tarfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from solidlsp.ls_exceptions import SolidLSPException
+from solidlsp.ls_utils import FileUtils
+
+
+def _create_tar_gz_bytes(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mode = 0o755
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+class _BrokenStream(io.RawIOBase):
+    """A stream which raises a connection error after {fail_after} bytes have been read."""
+
+    def __init__(self, data: bytes, fail_after: int) -> None:
+        self._data = io.BytesIO(data)
+        self._fail_after = fail_after
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        if self._data.tell() >= self._fail_after:
+            raise ConnectionResetError("connection reset by peer")
+        chunk = self._data.read(min(len(buffer), self._fail_after - self._data.tell()))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def _mock_response(status_code: int, body: bytes, raw: io.RawIOBase | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.raw = raw if raw is not None else io.BytesIO(body)
+    response.__enter__.return_value = response
+    return response
+
+
+def test_tar_archive_is_extracted_while_streaming(tmp_path: Path) -> None:
+    """Tar archives should be extracted directly from the response without a temporary download file."""
+    body = _create_tar_gz_bytes({"bin/tool": b"binary", "README": b"readme"})
+    with patch("solidlsp.ls_utils.requests.get", return_value=_mock_response(200, body)):
+        with patch.object(FileUtils, "download_file") as mock_download_file:
+            FileUtils.download_and_extract_archive("https://example.com/tool.tar.gz", str(tmp_path / "out"), "gztar")
+            mock_download_file.assert_not_called()
+
+    assert (tmp_path / "out" / "bin" / "tool").read_bytes() == b"binary"
+    assert (tmp_path / "out" / "README").read_bytes() == b"readme"
+
+
+def test_tar_archive_is_merged_into_existing_target(tmp_path: Path) -> None:
+    target_dir = tmp_path / "out"
+    (target_dir / "bin").mkdir(parents=True)
+    (target_dir / "bin" / "tool").write_bytes(b"old binary")
+    (target_dir / "other").write_bytes(b"other")
+
+    body = _create_tar_gz_bytes({"bin/tool": b"binary"})
+    with patch("solidlsp.ls_utils.requests.get", return_value=_mock_response(200, body)):
+        FileUtils.download_and_extract_archive("https://example.com/tool.tar.gz", str(target_dir), "gztar")
+
+    assert (target_dir / "bin" / "tool").read_bytes() == b"binary"
+    assert (target_dir / "other").read_bytes() == b"other"
+    assert os.listdir(tmp_path) == ["out"], "the temporary extraction directory should have been removed"
+
+
+def test_interrupted_tar_download_leaves_no_partial_files(tmp_path: Path) -> None:
+    """If the connection breaks during extraction, nothing may be written to the target directory."""
+    body = _create_tar_gz_bytes({"README": b"readme", "bin/tool": os.urandom(2 * 1024 * 1024)})
+    response = _mock_response(200, body, raw=_BrokenStream(body, fail_after=len(body) // 2))
+    with patch("solidlsp.ls_utils.requests.get", return_value=response):
+        with pytest.raises(SolidLSPException, match="Error extracting archive"):
+            FileUtils.download_and_extract_archive("https://example.com/tool.tar.gz", str(tmp_path / "out"), "gztar")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_tar_archive_download_error_raises(tmp_path: Path) -> None:
+    with patch("solidlsp.ls_utils.requests.get", return_value=_mock_response(404, b"")):
+        with pytest.raises(SolidLSPException, match="Error downloading file"):
+            FileUtils.download_and_extract_archive("https://example.com/tool.tar.gz", str(tmp_path / "out"), "gztar")
+    assert not (tmp_path / "out").exists()